@@ -1,3 +1,3 @@
-from . import database
+from . import ai, database
 
-__all__ = ['database'] 
\ No newline at end of file
+__all__ = ['ai', 'database'] 
\ No newline at end of file
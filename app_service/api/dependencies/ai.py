@@ -0,0 +1,15 @@
+from fastapi import HTTPException
+from logger_config import logger
+
+from config.settings import GEMINI_API_KEY
+
+# Computed once at import; the key cannot change while the process runs
+AI_READY = bool(GEMINI_API_KEY)
+
+def require_ai_configured() -> None:
+    """
+    Reject AI endpoints with 503 when no Gemini API key is configured.
+    """
+    if not AI_READY:
+        logger.error("AI API Key is not configured.")
+        raise HTTPException(status_code=503, detail="AI API Key not configured")
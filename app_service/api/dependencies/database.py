@@ -2,14 +2,14 @@ from fastapi import Depends
 import asyncpg
 from logger_config import logger
 
-from config.database import DATABASES, are_db_settings_valid
+from config.database import DATABASES, DB_POOL_MAX_SIZE, are_db_settings_valid
 
 # Global connection pool
 db_pool = None
 
-async def get_db_connection() -> asyncpg.Connection:
+async def _ensure_pool() -> asyncpg.Pool:
     """
-    Get a database connection from the pool.
+    Create the connection pool on first use and return it.
     """
     global db_pool
     
@@ -27,16 +27,31 @@ async def get_db_connection() -> asyncpg.Connection:
                 host=db_config['HOST'],
                 port=db_config['PORT'],
                 min_size=1,
-                max_size=10
+                max_size=DB_POOL_MAX_SIZE
             )
             logger.info("Database connection pool created successfully")
         except Exception as e:
             logger.error(f"Failed to create database connection pool: {str(e)}")
             raise
     
+    return db_pool
+
+async def get_db_pool() -> asyncpg.Pool:
+    """
+    Get the database connection pool itself, for endpoints that fan out
+    queries over several connections.
+    """
+    return await _ensure_pool()
+
+async def get_db_connection() -> asyncpg.Connection:
+    """
+    Get a database connection from the pool.
+    """
+    pool = await _ensure_pool()
+    
     try:
-        async with db_pool.acquire() as connection:
+        async with pool.acquire() as connection:
             yield connection
     except Exception as e:
         logger.error(f"Error acquiring database connection: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
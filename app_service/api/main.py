@@ -1,22 +1,32 @@
 import os
 import asyncio
 import asyncpg
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.exceptions import HTTPException as StarletteHTTPException
 import uvicorn
 from logger_config import logger
 
-from config.database import DATABASES, are_db_settings_valid
+from config.database import DATABASES, DB_POOL_MAX_SIZE, are_db_settings_valid
 from config.settings import (
     APP_NAME,
     APP_VERSION,
     APP_DESCRIPTION,
     GEMINI_API_KEY,
-    GEMINI_MODEL_NAME
+    GEMINI_MODEL_NAME,
+    HOST,
+    SERVER_PORT,
+    DEBUG,
+    WORKERS,
+    UVICORN_OPTIONS
 )
 
 from .routers import database, deals
-from .dependencies.database import db_pool
+from .dependencies import database as db_dependencies
+from .services.deal_cache import init_deal_cache, close_deal_cache
+from .services.upswap_service import UpswapService
 
 # --- APPLICATION CONFIGURATION ---
 logger.info("--- Initializing Application ---")
@@ -28,13 +38,16 @@ if not DB_CONFIG:
     logger.critical("FATAL: 'default' database configuration not found. Application may not function correctly with DB features.")
 else:
     DB_SETTINGS_VALID = are_db_settings_valid('default')
-    logger.info(f"DATABASE_ENGINE: {DB_CONFIG.get('ENGINE')}")
-    logger.info(f"DATABASE_NAME: {'Set' if DB_CONFIG.get('NAME') else 'Not Set'}")
-    logger.info(f"DATABASE_USER: {'Set' if DB_CONFIG.get('USER') else 'Not Set'}")
-    logger.info(f"DATABASE_PASSWORD: {'Set' if DB_CONFIG.get('PASSWORD') else 'Not Set (or empty)'}")
-    logger.info(f"DATABASE_HOST: {'Set' if DB_CONFIG.get('HOST') else 'Not Set'}")
-    logger.info(f"DATABASE_PORT: {DB_CONFIG.get('PORT') if DB_CONFIG.get('PORT') is not None else 'Invalid/Not Set'}")
-    logger.info(f"Overall database settings validity for 'default': {DB_SETTINGS_VALID}")
+    logger.info(
+        f"Database settings for 'default': "
+        f"engine={DB_CONFIG.get('ENGINE')}, "
+        f"name={'Set' if DB_CONFIG.get('NAME') else 'Not Set'}, "
+        f"user={'Set' if DB_CONFIG.get('USER') else 'Not Set'}, "
+        f"password={'Set' if DB_CONFIG.get('PASSWORD') else 'Not Set (or empty)'}, "
+        f"host={'Set' if DB_CONFIG.get('HOST') else 'Not Set'}, "
+        f"port={DB_CONFIG.get('PORT') if DB_CONFIG.get('PORT') is not None else 'Invalid/Not Set'}, "
+        f"valid={DB_SETTINGS_VALID}"
+    )
 
 # AI Configuration
 if not GEMINI_API_KEY:
@@ -44,7 +57,8 @@ if not GEMINI_API_KEY:
 app = FastAPI(
     title="Deals Agent API",
     description="API for managing deals and suggestions",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -56,6 +70,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as /database/schema/*; small payloads are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Error responses use orjson as well, matching the default response class
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=getattr(exc, "headers", None)
+    )
+
 # Include routers
 app.include_router(database.router)
 app.include_router(deals.router)
@@ -70,7 +96,8 @@ async def read_root():
 @app.on_event("startup")
 async def startup_event():
     logger.info("Application startup: FastAPI server is starting.")
-    global db_pool
+
+    await init_deal_cache()
     
     if not DB_SETTINGS_VALID or not DB_CONFIG:
         logger.error("Database configuration (from config.py) is incomplete or invalid. DB pool will not be created.")
@@ -81,6 +108,7 @@ async def startup_event():
         f"{DB_CONFIG['USER']}@{DB_CONFIG['HOST']}:{DB_CONFIG['PORT']}/{DB_CONFIG['NAME']}"
     )
     try:
+        # Populate the pool the request dependencies use, so they do not lazily create a second one
         db_pool = await asyncpg.create_pool(
             user=DB_CONFIG['USER'],
             password=DB_CONFIG.get('PASSWORD'),
@@ -88,24 +116,33 @@ async def startup_event():
             host=DB_CONFIG['HOST'],
             port=DB_CONFIG['PORT'],
             min_size=1,
-            max_size=10,
+            max_size=DB_POOL_MAX_SIZE,
             timeout=10, # Connection timeout
             command_timeout=15 # Default command timeout
         )
         async with db_pool.acquire() as conn: # Test connection
             db_version = await conn.fetchval("SELECT version();")
             logger.info(f"Database connection pool created successfully. PostgreSQL Version: {db_version}")
+        db_dependencies.db_pool = db_pool
     except Exception as e:
         logger.error(f"Failed to create database connection pool: {e}", exc_info=True)
-        db_pool = None # Ensure pool is None if creation fails
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Application shutdown: Server is shutting down.")
-    if db_pool:
-        logger.info("Closing database connection pool...")
-        await db_pool.close()
+    await close_deal_cache()
+    await UpswapService.close()
+    if db_dependencies.db_pool:
+        await db_dependencies.db_pool.close()
+        db_dependencies.db_pool = None
         logger.info("Database connection pool closed.")
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8008, reload=True) 
\ No newline at end of file
+    uvicorn.run(
+        "api.main:app" if DEBUG or WORKERS > 1 else app,
+        host=HOST,
+        port=SERVER_PORT,
+        reload=DEBUG,
+        workers=WORKERS,
+        **UVICORN_OPTIONS
+    ) 
\ No newline at end of file
@@ -15,6 +15,7 @@ class Table(BaseModel):
 
 class TableSchema(BaseModel):
     tables: List[Table]
+    next_offset: Optional[int] = None
 
 class TableStat(BaseModel):
     schema: str
@@ -24,6 +25,7 @@ class TableStat(BaseModel):
 class DatabaseStats(BaseModel):
     database_size: str
     tables: List[TableStat]
+    next_offset: Optional[int] = None
 
 class DatabaseStatsResponse(BaseModel):
     tables: List[TableStat]
@@ -1,6 +1,15 @@
-from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel, Field, conlist
+from typing import Annotated, List, Dict, Any, Literal, Optional, Union
+from pydantic import BaseModel, Field, StringConstraints, conlist, model_validator
 from datetime import datetime
+from config.settings import BULK_SUGGEST_MAX_ITEMS
+
+# Format checks on string fields forwarded to the Upswap API, so malformed input
+# is rejected here instead of after a round-trip. Patterns are compiled once by pydantic-core.
+# Only shapes Upswap itself uses are enforced (ISO dates, HH:MM[:SS[.ffffff]] times, whole counts);
+# prices, flags and ids are passed through for Upswap to judge.
+DateStr = Annotated[str, StringConstraints(pattern=r"^\d{4}-\d{2}-\d{2}$")]
+TimeStr = Annotated[str, StringConstraints(pattern=r"^\d{2}:\d{2}(:\d{2}(\.\d+)?)?$")]
+CountStr = Annotated[str, StringConstraints(pattern=r"^\d+$")]
 
 class EventData(BaseModel):
     vendor_id: str
@@ -20,6 +29,18 @@ class InventoryItem(BaseModel):
     category: str
     supplier: Optional[str] = None
 
+class AiDealRaw(BaseModel):
+    suggested_product_sku: str
+    deal_details_suggestion_text: str
+    suggested_discount_type: Literal["fixed_amount", "percentage"]
+    suggested_discount_value: float = Field(ge=0)
+
+    @model_validator(mode="after")
+    def check_percentage(self) -> "AiDealRaw":
+        if self.suggested_discount_type == "percentage" and self.suggested_discount_value > 100:
+            raise ValueError("percentage discount cannot exceed 100")
+        return self
+
 class DealSuggestion(BaseModel):
     vendor_id: str
     event_id: int
@@ -40,6 +61,15 @@ class DealSuggestionRequest(BaseModel):
     event_data: EventData
     inventory_items: List[InventoryItem]
 
+class BulkDealSuggestionRequest(BaseModel):
+    requests: List[DealSuggestionRequest] = Field(..., min_length=1, max_length=BULK_SUGGEST_MAX_ITEMS)
+
+class BulkDealSuggestionResult(BaseModel):
+    index: int
+    success: bool
+    suggestions: List[DealSuggestion] = []
+    error: Optional[str] = None
+
 class ErrorResponse(BaseModel):
     error: str
     details: Optional[Union[str, List[str]]] = None
@@ -54,14 +84,14 @@ class CreateDealRequest(BaseModel):
     deal_description: str
     select_service: str
     uploaded_images: List[DealImage]
-    start_date: str
-    end_date: str
-    start_time: str
-    end_time: str
+    start_date: DateStr
+    end_date: DateStr
+    start_time: TimeStr
+    end_time: TimeStr
     start_now: str
     actual_price: str
     deal_price: str
-    available_deals: str
+    available_deals: CountStr
     location_house_no: str
     location_road_name: str
     location_country: str
@@ -107,4 +137,13 @@ class CreateDealResponse(BaseModel):
     success: bool
     message: str
     data: Optional[DealResponseData] = None
-    error: Optional[str] = None 
\ No newline at end of file
+    error: Optional[str] = None
+
+class CreateDealAcceptedResponse(BaseModel):
+    tracking_id: str
+    status: str
+
+class CreateDealStatusResponse(BaseModel):
+    tracking_id: str
+    status: str
+    result: Optional[CreateDealResponse] = None
\ No newline at end of file
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any, Optional
 import asyncpg
 from logger_config import logger
 
-from ..dependencies.database import get_db_connection
+from ..dependencies.database import get_db_connection, get_db_pool
 from ..models.database import DatabaseStats, TableSchema
 
 router = APIRouter(
@@ -12,26 +14,40 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+def _next_offset(offset: int, limit: int, page_size: int) -> Optional[int]:
+    """Offset of the following page, or None when this page was the last one."""
+    return offset + limit if page_size == limit else None
+
 @router.get("/stats", response_model=DatabaseStats)
-async def get_database_stats(conn: asyncpg.Connection = Depends(get_db_connection)):
+async def get_database_stats(
+    limit: int = Query(200, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    pool: asyncpg.Pool = Depends(get_db_pool)
+):
     """
-    Get database statistics including table counts and row counts.
+    Get database statistics including table counts and row counts, one page of tables at a time.
     """
+    async def fetch_table_stats():
+        async with pool.acquire() as conn:
+            return await conn.fetch("""
+                SELECT 
+                    schemaname as schema,
+                    relname as table,
+                    n_live_tup as row_count
+                FROM pg_stat_user_tables
+                ORDER BY schemaname, relname
+                LIMIT $1 OFFSET $2;
+            """, limit, offset)
+
+    async def fetch_db_size():
+        async with pool.acquire() as conn:
+            return await conn.fetchval("""
+                SELECT pg_size_pretty(pg_database_size(current_database()));
+            """)
+
     try:
-        # Get table statistics
-        table_stats = await conn.fetch("""
-            SELECT 
-                schemaname as schema,
-                relname as table,
-                n_live_tup as row_count
-            FROM pg_stat_user_tables
-            ORDER BY schemaname, relname;
-        """)
-        
-        # Get database size
-        db_size = await conn.fetchval("""
-            SELECT pg_size_pretty(pg_database_size(current_database()));
-        """)
+        # Run both queries concurrently, each on its own pooled connection
+        table_stats, db_size = await asyncio.gather(fetch_table_stats(), fetch_db_size())
         
         # Format results
         tables = []
@@ -42,10 +58,11 @@ async def get_database_stats(conn: asyncpg.Connection = Depends(get_db_connectio
                 "row_count": stat["row_count"]
             })
         
-        return {
+        return ORJSONResponse(content={
             "database_size": db_size,
-            "tables": tables
-        }
+            "tables": tables,
+            "next_offset": _next_offset(offset, limit, len(tables))
+        })
     except Exception as e:
         logger.error(f"Error getting database stats: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get database statistics")
@@ -53,12 +70,24 @@ async def get_database_stats(conn: asyncpg.Connection = Depends(get_db_connectio
 @router.get("/schema/{table_prefix}", response_model=TableSchema)
 async def get_table_schema(
     table_prefix: str,
+    limit: int = Query(200, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     conn: asyncpg.Connection = Depends(get_db_connection)
 ):
     """
-    Get schema information for tables matching the given prefix.
+    Get schema information for tables matching the given prefix, paginated by table.
     """
     try:
+        # Resolve the page of matching tables first so the column scan is bounded
+        matching_tables = await conn.fetch("""
+            SELECT table_schema || '.' || table_name AS table_key
+            FROM information_schema.tables
+            WHERE table_name LIKE $1
+            ORDER BY table_schema, table_name
+            LIMIT $2 OFFSET $3;
+        """, f"{table_prefix}%", limit, offset)
+        table_keys = [row["table_key"] for row in matching_tables]
+
         # Get column information
         columns = await conn.fetch("""
             SELECT 
@@ -69,9 +98,9 @@ async def get_table_schema(
                 is_nullable,
                 column_default
             FROM information_schema.columns
-            WHERE table_name LIKE $1
+            WHERE table_schema || '.' || table_name = ANY($1::text[])
             ORDER BY table_schema, table_name, ordinal_position;
-        """, f"{table_prefix}%")
+        """, table_keys)
         
         # Get primary key information
         primary_keys = await conn.fetch("""
@@ -85,8 +114,8 @@ async def get_table_schema(
                 AND kc.table_schema = tc.table_schema
                 AND kc.constraint_name = tc.constraint_name
             WHERE tc.constraint_type = 'PRIMARY KEY'
-                AND tc.table_name LIKE $1;
-        """, f"{table_prefix}%")
+                AND tc.table_schema || '.' || tc.table_name = ANY($1::text[]);
+        """, table_keys)
         
         # Format results
         tables = {}
@@ -113,9 +142,10 @@ async def get_table_schema(
             if table_key in tables:
                 tables[table_key]["primary_keys"].append(pk["column_name"])
         
-        return {
-            "tables": list(tables.values())
-        }
+        return ORJSONResponse(content={
+            "tables": list(tables.values()),
+            "next_offset": _next_offset(offset, limit, len(table_keys))
+        })
     except Exception as e:
         logger.error(f"Error getting table schema: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get table schema") 
\ No newline at end of file
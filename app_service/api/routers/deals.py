@@ -1,12 +1,26 @@
-from fastapi import APIRouter, HTTPException, Depends
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from typing import List
 import asyncpg
 from logger_config import logger
 
+from ..dependencies.ai import require_ai_configured
 from ..dependencies.database import get_db_connection
-from ..models.deals import DealSuggestion, DealSuggestionRequest, ErrorResponse, CreateDealRequest, CreateDealResponse
-from ..services.ai_service import get_deal_suggestions
+from ..models.deals import (
+    DealSuggestion,
+    DealSuggestionRequest,
+    BulkDealSuggestionRequest,
+    BulkDealSuggestionResult,
+    ErrorResponse,
+    CreateDealRequest,
+    CreateDealResponse,
+    CreateDealAcceptedResponse,
+    CreateDealStatusResponse
+)
+from ..services.ai_service import deal_cache_key, get_deal_suggestions
 from ..services.upswap_service import UpswapService
+from ..services import deal_jobs
 
 router = APIRouter(
     prefix="/deals",
@@ -14,7 +28,11 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.post("/suggest", response_model=List[DealSuggestion])
+@router.post(
+    "/suggest",
+    response_model=List[DealSuggestion],
+    dependencies=[Depends(require_ai_configured)]
+)
 async def suggest_deals(
     request: DealSuggestionRequest,
     conn: asyncpg.Connection = Depends(get_db_connection)
@@ -25,11 +43,51 @@ async def suggest_deals(
     try:
         # Get deal suggestions from AI service
         suggestions = await get_deal_suggestions(request, conn)
-        return suggestions
+        # Return the response directly so FastAPI skips re-validating against response_model
+        return ORJSONResponse(content=[suggestion.model_dump() for suggestion in suggestions])
     except Exception as e:
         logger.error(f"Error getting deal suggestions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get deal suggestions")
 
+@router.post(
+    "/suggest/bulk",
+    response_model=List[BulkDealSuggestionResult],
+    dependencies=[Depends(require_ai_configured)]
+)
+async def suggest_deals_bulk(request: BulkDealSuggestionRequest):
+    """
+    Get AI-powered deal suggestions for several events in one call.
+    Requests fan out concurrently under the shared Gemini rate limiter; each item reports its own outcome.
+    Batch size is capped by GEMINI_REQUESTS_PER_MINUTE, and no DB connection is held while the batch
+    waits on the rate limiter.
+    """
+    # Identical items would all miss the cache at once; generate each distinct deal only once
+    keys = [deal_cache_key(item) for item in request.requests]
+    unique_items = {}
+    for key, item in zip(keys, request.requests):
+        unique_items.setdefault(key, item)
+
+    unique_results = await asyncio.gather(
+        *(get_deal_suggestions(item, None) for item in unique_items.values()),
+        return_exceptions=True
+    )
+    results_by_key = dict(zip(unique_items, unique_results))
+
+    response = []
+    for index, key in enumerate(keys):
+        result = results_by_key[key]
+        if isinstance(result, Exception):
+            logger.error(f"Error getting deal suggestions for bulk item {index}: {str(result)}")
+            response.append({"index": index, "success": False, "suggestions": [], "error": "Failed to get deal suggestions"})
+        else:
+            response.append({
+                "index": index,
+                "success": True,
+                "suggestions": [suggestion.model_dump() for suggestion in result],
+                "error": None
+            })
+    return ORJSONResponse(content=response)
+
 @router.post("/create-deal", response_model=CreateDealResponse)
 async def create_deal(deal_data: CreateDealRequest):
     """
@@ -48,4 +106,24 @@ async def create_deal(deal_data: CreateDealRequest):
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+@router.post("/create-deal/async", response_model=CreateDealAcceptedResponse, status_code=202)
+async def create_deal_async(deal_data: CreateDealRequest, background_tasks: BackgroundTasks):
+    """
+    Queue deal creation and return immediately with a tracking id.
+    The Upswap call runs after the response is sent; poll /deals/create-deal/status/{tracking_id} for the outcome.
+    """
+    tracking_id = await deal_jobs.create_job()
+    background_tasks.add_task(deal_jobs.run_create_deal, tracking_id, deal_data)
+    return ORJSONResponse(status_code=202, content={"tracking_id": tracking_id, "status": "accepted"})
+
+@router.get("/create-deal/status/{tracking_id}", response_model=CreateDealStatusResponse)
+async def get_create_deal_status(tracking_id: str):
+    """
+    Get the status of a deal queued through /deals/create-deal/async
+    """
+    job = await deal_jobs.get_job(tracking_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown tracking id")
+    return ORJSONResponse(content=job)
\ No newline at end of file
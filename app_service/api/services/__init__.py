@@ -1,3 +1,3 @@
-from . import ai_service
+from . import ai_service, deal_cache, deal_jobs, rate_limiter
 
-__all__ = ['ai_service'] 
\ No newline at end of file
+__all__ = ['ai_service', 'deal_cache', 'deal_jobs', 'rate_limiter'] 
\ No newline at end of file
@@ -1,48 +1,134 @@
 import os
-import json
 import re
-from typing import Dict, Any, List
+from decimal import Decimal
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+import orjson
+from pydantic import ValidationError
 from logger_config import logger
-from ..models.deals import EventData, InventoryItem, DealSuggestion, DealSuggestionRequest
-from config.settings import GEMINI_API_KEY, GEMINI_MODEL_NAME
+from ..models.deals import AiDealRaw, EventData, InventoryItem, DealSuggestion, DealSuggestionRequest
+from config.settings import (
+    GEMINI_API_KEY,
+    GEMINI_MODEL_NAME,
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_MAX_CONCURRENCY
+)
+from .deal_cache import make_cache_key, get_cached_deal, cache_deal
+from .rate_limiter import SlidingWindow, AimdConcurrency
 import asyncpg
 
-# Initialize Gemini AI
-genai.configure(api_key=GEMINI_API_KEY)
-model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+# Matches the object inside a ```json fence the model sometimes wraps its output in.
+# The closing fence is optional: streaming stops at the closing brace, before it arrives.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{[\s\S]*\})")
 
-def generate_deal_from_ai(event_data: EventData, inventory_list: List[InventoryItem]) -> Dict[str, Any]:
-    """Generates a product deal suggestion using a generative AI model."""
-    if not GEMINI_API_KEY:
-        logger.error("AI API Key is not configured.")
-        raise ValueError("AI API Key not configured.")
+_CENTS = Decimal("0.01")
+_HUNDRED = Decimal(100)
+
+_INVENTORY_FIELDS = tuple(InventoryItem.model_fields)
+
+@lru_cache(maxsize=128)
+def _serialize_inventory(inventory_rows: Tuple[tuple, ...]) -> str:
+    """Serialize inventory rows for the prompt, cached so repeat inventories skip the dump."""
+    return orjson.dumps(
+        [dict(zip(_INVENTORY_FIELDS, row)) for row in inventory_rows],
+        option=orjson.OPT_INDENT_2
+    ).decode()
 
+# Initialize Gemini AI once per process; the model is reused across requests
+GENERATION_CONFIG = {
+    "temperature": 0.7, "top_p": 0.95, "top_k": 40,
+    "max_output_tokens": 1024, "response_mime_type": "application/json",
+}
+SAFETY_SETTINGS = [
+    {"category": c, "threshold": "BLOCK_MEDIUM_AND_ABOVE"}
+    for c in ["HARM_CATEGORY_HARASSMENT", "HARM_CATEGORY_HATE_SPEECH",
+              "HARM_CATEGORY_SEXUALLY_EXPLICIT", "HARM_CATEGORY_DANGEROUS_CONTENT"]
+]
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+GEMINI_MODEL = genai.GenerativeModel(
+    model_name=GEMINI_MODEL_NAME,
+    generation_config=GENERATION_CONFIG,
+    safety_settings=SAFETY_SETTINGS
+)
+GEMINI_WINDOW = SlidingWindow(GEMINI_REQUESTS_PER_MINUTE)
+GEMINI_CONCURRENCY = AimdConcurrency(GEMINI_MAX_CONCURRENCY)
+
+async def _read_json_stream(response) -> str:
+    """Accumulate streamed text, stopping once the top-level JSON object closes instead of waiting on the decode tail."""
+    text = ""
+    depth = 0
+    in_string = escaped = False
+    async for chunk in response:
+        if not chunk.parts:
+            continue
+        text += chunk.text
+        # Braces inside string literals (e.g. "Smile :}") must not count towards the object's depth
+        for char in chunk.text:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return text
+    return text
+
+def _parse_ai_deal(ai_output_json: str) -> AiDealRaw:
+    """Validate the model output, falling back to a fenced block only when the plain parse fails."""
     try:
-        generation_config = {
-            "temperature": 0.7, "top_p": 0.95, "top_k": 40,
-            "max_output_tokens": 1024, "response_mime_type": "application/json",
-        }
-        safety_settings = [
-            {"category": c, "threshold": "BLOCK_MEDIUM_AND_ABOVE"}
-            for c in ["HARM_CATEGORY_HARASSMENT", "HARM_CATEGORY_HATE_SPEECH",
-                      "HARM_CATEGORY_SEXUALLY_EXPLICIT", "HARM_CATEGORY_DANGEROUS_CONTENT"]
-        ]
-        model = genai.GenerativeModel(
-            model_name="gemini-1.5-flash-latest",
-            generation_config=generation_config,
-            safety_settings=safety_settings
-        )
+        return AiDealRaw.model_validate_json(ai_output_json)
+    except ValidationError:
+        match = _JSON_FENCE_RE.search(ai_output_json)
+        if not match:
+            raise
+        return AiDealRaw.model_validate_json(match.group(1))
+
+def _prompt_inputs(event_data: EventData, inventory_list: List[InventoryItem]) -> Tuple[Dict[str, InventoryItem], str, str]:
+    """Build the SKU lookup and the serialized event and inventory used for both the prompt and the cache key."""
+    # Single pass: SKU lookup for validation plus hashable rows for the cached prompt dump
+    inventory_map = {}
+    inventory_rows = []
+    for item in inventory_list:
+        inventory_map[item.sku] = item
+        inventory_rows.append(tuple(getattr(item, field) for field in _INVENTORY_FIELDS))
+    return inventory_map, event_data.model_dump_json(indent=2), _serialize_inventory(tuple(inventory_rows))
+
+def deal_cache_key(request: DealSuggestionRequest) -> str:
+    """Cache key of the deal a request would generate; equal keys get the same suggestion."""
+    _, event_json, inventory_json = _prompt_inputs(request.event_data, request.inventory_items)
+    return make_cache_key(event_json, inventory_json)
+
+async def generate_deal_from_ai(event_data: EventData, inventory_list: List[InventoryItem]) -> Dict[str, Any]:
+    """Generates a product deal suggestion using a generative AI model."""
+    try:
+        inventory_map, event_json, inventory_json = _prompt_inputs(event_data, inventory_list)
+
+        # A previously seen event + inventory pair skips the Gemini call entirely
+        cache_key = make_cache_key(event_json, inventory_json)
+        cached_deal = await get_cached_deal(cache_key)
+        if cached_deal is not None:
+            logger.info(f"Deal cache hit for {cache_key}")
+            return cached_deal
 
         prompt = f"""
         You are an expert marketing assistant. Analyze event details and inventory to suggest ONE compelling product deal.
-        Event: {json.dumps(event_data.model_dump(), indent=2)}
-        Inventory: {json.dumps([item.model_dump() for item in inventory_list], indent=2)}
+        Event: {event_json}
+        Inventory: {inventory_json}
 
         Select ONE product. Discount should be 10-30% or a meaningful fixed amount.
         'deal_details_suggestion_text' should be catchy, concise, highlight benefit/savings, and relevant to the event.
-        'suggested_product_sku' must be from inventory. Use its 'price' as 'original_price'.
-        Calculate 'suggested_price'. 'suggested_discount_type' is 'fixed_amount' or 'percentage'.
+        'suggested_product_sku' must be from inventory. 'suggested_discount_type' is 'fixed_amount' or 'percentage'.
         If 'percentage', 'suggested_discount_value' is the percent number (e.g., 20 for 20%).
         If 'fixed_amount', 'suggested_discount_value' is currency amount (e.g., 80.00).
 
@@ -51,70 +137,70 @@ def generate_deal_from_ai(event_data: EventData, inventory_list: List[InventoryI
           "suggested_product_sku": "string",
           "deal_details_suggestion_text": "string",
           "suggested_discount_type": "string",
-          "suggested_discount_value": "float",
-          "original_price": "float",
-          "suggested_price": "float"
+          "suggested_discount_value": "float"
         }}
         Example for a marathon and umbrella:
         {{
           "suggested_product_sku": "UMB-LG-BLK-001",
           "deal_details_suggestion_text": "Beat the rain at the {event_data.event_details_text.get('event_name', 'event')}! Large Umbrella, was ₹400, now ₹320! Stay dry. Limited stock!",
           "suggested_discount_type": "fixed_amount",
-          "suggested_discount_value": 80.00,
-          "original_price": 400.00,
-          "suggested_price": 320.00
+          "suggested_discount_value": 80.00
         }}
         """
-        response = model.generate_content(prompt)
+        # Throttle ourselves before Gemini does: rolling RPM window plus an AIMD concurrency cap.
+        # Wait on the window before taking a slot so slots are never held by tasks that are only sleeping.
+        await GEMINI_WINDOW.wait()
+        async with GEMINI_CONCURRENCY.slot():
+            try:
+                response = await GEMINI_MODEL.generate_content_async(prompt, stream=True)
+                ai_output_json = await _read_json_stream(response)
+            except google_exceptions.ResourceExhausted:
+                GEMINI_CONCURRENCY.on_throttled()
+                logger.warning(f"Gemini rate limited; concurrency cap lowered to {GEMINI_CONCURRENCY.limit:.1f}")
+                raise
+            GEMINI_CONCURRENCY.on_success()
 
-        if not response.parts:
+        if not ai_output_json:
             block_reason = "Unknown reason."
             if response.prompt_feedback and response.prompt_feedback.block_reason:
                 block_reason = response.prompt_feedback.block_reason_message or str(response.prompt_feedback.block_reason)
             logger.error(f"AI model did not return content. Blocked: {block_reason}")
             raise ValueError(f"AI model response empty/blocked: {block_reason}")
 
-        ai_output_json = response.text
-        match = re.search(r"```json\s*([\s\S]*?)\s*```", ai_output_json, re.DOTALL)
-        if match:
-            ai_output_json = match.group(1)
-        
-        deal_suggestion = json.loads(ai_output_json)
+        ai_output_json = ai_output_json.strip()
+        raw_deal = _parse_ai_deal(ai_output_json)
 
         # Validation
-        selected_sku = deal_suggestion.get("suggested_product_sku")
-        inventory_map = {item.sku: item for item in inventory_list}
+        selected_sku = raw_deal.suggested_product_sku
 
-        if not selected_sku or selected_sku not in inventory_map:
+        if selected_sku not in inventory_map:
             logger.error(f"AI suggested SKU '{selected_sku}' not in inventory.")
             raise ValueError(f"AI suggested SKU '{selected_sku}' not in inventory.")
         
         actual_item = inventory_map[selected_sku]
-        deal_suggestion["original_price"] = actual_item.price # Enforce actual price
+        discount_value = Decimal(str(raw_deal.suggested_discount_value))
 
-        original_price = deal_suggestion["original_price"]
-        discount_type = deal_suggestion.get("suggested_discount_type")
-        discount_value = float(deal_suggestion.get("suggested_discount_value", 0))
-        
-        calculated_suggested_price = original_price
-        if discount_type == "fixed_amount":
-            calculated_suggested_price = original_price - discount_value
-        elif discount_type == "percentage":
-            calculated_suggested_price = original_price * (1 - discount_value / 100)
-        
-        # Use calculated price, rounded, and warn if AI's differs significantly
-        if abs(deal_suggestion.get("suggested_price", float('inf')) - calculated_suggested_price) > 0.01:
-            logger.warning(
-                f"AI suggested price {deal_suggestion.get('suggested_price')} differs from "
-                f"calculated {calculated_suggested_price:.2f} for SKU {selected_sku}. Using calculated."
-            )
-        deal_suggestion["suggested_price"] = round(calculated_suggested_price, 2)
+        # Price comes from inventory, not the model; Decimal avoids binary float rounding
+        original_price = Decimal(str(actual_item.price))
+        if raw_deal.suggested_discount_type == "fixed_amount":
+            suggested_price = original_price - discount_value
+        else:
+            suggested_price = original_price * (_HUNDRED - discount_value) / _HUNDRED
+
+        if suggested_price < 0:
+            logger.error(f"AI discount {discount_value} ({raw_deal.suggested_discount_type}) exceeds price {original_price} for SKU '{selected_sku}'.")
+            raise ValueError(f"AI suggested discount exceeds the price of SKU '{selected_sku}'.")
+
+        deal_suggestion = raw_deal.model_dump()
+        deal_suggestion["original_price"] = float(original_price)
+        deal_suggestion["suggested_price"] = float(suggested_price.quantize(_CENTS))
 
+        await cache_deal(cache_key, deal_suggestion)
         return deal_suggestion
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse AI JSON response: {e}. Raw: {response.text if 'response' in locals() else 'N/A'}", exc_info=True)
-        raise ValueError(f"AI response not valid JSON: {e}")
+    except ValidationError as e:
+        logger.error(f"Failed to parse AI JSON response: {e}. Raw: {ai_output_json if 'ai_output_json' in locals() else 'N/A'}", exc_info=True)
+        raise ValueError(f"AI response not valid deal JSON: {e}")
     except genai.types.generation_types.BlockedPromptException as e:
         logger.error(f"AI prompt blocked: {e}", exc_info=True)
         raise # Re-raise to be caught by endpoint
@@ -131,7 +217,7 @@ async def get_deal_suggestions(
     """
     try:
         # Generate deal suggestion using AI
-        deal_suggestion = generate_deal_from_ai(request.event_data, request.inventory_items)
+        deal_suggestion = await generate_deal_from_ai(request.event_data, request.inventory_items)
         
         # Create DealSuggestion object
         suggestion = DealSuggestion(
@@ -0,0 +1,96 @@
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import orjson
+from logger_config import logger
+from config.settings import REDIS_URL, DEAL_CACHE_TTL_SECONDS, DEAL_CACHE_LOCAL_SIZE
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis is optional; the in-process tier still works without it
+    aioredis = None
+
+# In-process LRU tier, always available
+_local_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Shared Redis tier, set up by init_deal_cache() when REDIS_URL is configured
+_redis = None
+
+def make_cache_key(event_json: str, inventory_json: str) -> str:
+    """Build a stable cache key from the serialized event and inventory."""
+    digest = hashlib.sha256()
+    digest.update(event_json.encode())
+    digest.update(inventory_json.encode())
+    return f"deal:{digest.hexdigest()}"
+
+async def init_deal_cache() -> None:
+    """Connect to Redis if configured; on any failure fall back to the in-process cache only."""
+    global _redis
+
+    if not REDIS_URL:
+        logger.info("REDIS_URL not set. Using in-process deal cache only.")
+        return
+    if aioredis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed. Using in-process deal cache only.")
+        return
+
+    try:
+        client = aioredis.from_url(REDIS_URL)
+        await client.ping()
+        _redis = client
+        logger.info("Connected to Redis for shared deal cache.")
+    except Exception as e:
+        logger.warning(f"Could not connect to Redis, using in-process deal cache only: {e}")
+        _redis = None
+
+async def close_deal_cache() -> None:
+    """Close the Redis connection if one was opened."""
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+def get_redis():
+    """The shared Redis client opened by init_deal_cache(), or None when running without Redis."""
+    return _redis
+
+def _remember_locally(key: str, deal: Dict[str, Any]) -> None:
+    _local_cache[key] = deal
+    _local_cache.move_to_end(key)
+    if len(_local_cache) > DEAL_CACHE_LOCAL_SIZE:
+        _local_cache.popitem(last=False)
+
+async def get_cached_deal(key: str) -> Optional[Dict[str, Any]]:
+    """Look up a deal in the local cache first, then in Redis."""
+    deal = _local_cache.get(key)
+    if deal is not None:
+        _local_cache.move_to_end(key)
+        return deal
+
+    if _redis is None:
+        return None
+
+    try:
+        cached = await _redis.get(key)
+    except Exception as e:
+        logger.warning(f"Redis GET failed for {key}: {e}")
+        return None
+    if cached is None:
+        return None
+
+    deal = orjson.loads(cached)
+    _remember_locally(key, deal)
+    return deal
+
+async def cache_deal(key: str, deal: Dict[str, Any]) -> None:
+    """Store a deal in both cache tiers."""
+    _remember_locally(key, deal)
+
+    if _redis is None:
+        return
+
+    try:
+        await _redis.setex(key, DEAL_CACHE_TTL_SECONDS, orjson.dumps(deal))
+    except Exception as e:
+        logger.warning(f"Redis SETEX failed for {key}: {e}")
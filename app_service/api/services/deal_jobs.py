@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from uuid import uuid4
+import orjson
+from logger_config import logger
+from ..models.deals import CreateDealRequest
+from .deal_cache import get_redis
+from .upswap_service import UpswapService
+
+# Job state goes to Redis when it is configured, so a status poll can land on any worker.
+# The in-process map is the fallback when Redis is absent or unreachable; it then tracks only this worker's jobs.
+JOB_TTL_SECONDS = 24 * 3600
+MAX_TRACKED_JOBS = 1000
+FINISHED_STATUSES = ("completed", "failed")
+_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def _job_key(tracking_id: str) -> str:
+    return f"deal_job:{tracking_id}"
+
+def _evict_finished_jobs() -> None:
+    """Drop the oldest finished jobs beyond MAX_TRACKED_JOBS; jobs still running are never evicted."""
+    excess = len(_jobs) - MAX_TRACKED_JOBS
+    if excess <= 0:
+        return
+    for tracking_id in [tid for tid, job in _jobs.items() if job["status"] in FINISHED_STATUSES][:excess]:
+        del _jobs[tracking_id]
+
+async def _save_job(job: Dict[str, Any]) -> None:
+    _jobs[job["tracking_id"]] = job
+    _evict_finished_jobs()
+
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.setex(_job_key(job["tracking_id"]), JOB_TTL_SECONDS, orjson.dumps(job))
+    except Exception as e:
+        logger.warning(f"Redis SETEX failed for job {job['tracking_id']}: {e}")
+
+async def create_job() -> str:
+    """Register a new pending job and return its tracking id."""
+    tracking_id = uuid4().hex
+    await _save_job({"tracking_id": tracking_id, "status": "accepted", "result": None})
+    return tracking_id
+
+async def get_job(tracking_id: str) -> Optional[Dict[str, Any]]:
+    """Get the current state of a job, or None if it is unknown or has expired."""
+    redis = get_redis()
+    if redis is not None:
+        try:
+            cached = await redis.get(_job_key(tracking_id))
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning(f"Redis GET failed for job {tracking_id}: {e}")
+    return _jobs.get(tracking_id)
+
+async def run_create_deal(tracking_id: str, deal_data: CreateDealRequest) -> None:
+    """Create the deal and record the outcome against the tracking id."""
+    job = {"tracking_id": tracking_id, "status": "processing", "result": None}
+    await _save_job(job)
+
+    response = await UpswapService.create_deal(deal_data)
+    job["status"] = "completed" if response.success else "failed"
+    job["result"] = response.model_dump()
+    await _save_job(job)
+    logger.info(f"Background deal creation {tracking_id} {job['status']}")
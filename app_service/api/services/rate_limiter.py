@@ -0,0 +1,55 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+class SlidingWindow:
+    """Allow at most max_calls calls in any rolling window of period seconds."""
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until a call fits in the window, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+
+class AimdConcurrency:
+    """Concurrency cap that grows additively on success and halves when the upstream throttles."""
+
+    def __init__(self, max_limit: int, increase: float = 0.5, decrease: float = 0.5):
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the currently allowed concurrent slots."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def on_success(self) -> None:
+        self.limit = min(float(self.max_limit), self.limit + self.increase)
+
+    def on_throttled(self) -> None:
+        self.limit = max(1.0, self.limit * self.decrease)
@@ -1,10 +1,36 @@
 import httpx
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..models.deals import CreateDealRequest, CreateDealResponse, DealResponseData
 from logger_config import logger
+from config.settings import UPSWAP_POOL_SIZE
 
 class UpswapService:
     BASE_URL = "https://api.upswap.app/api"
+    CREATE_DEAL_URL = f"{BASE_URL}/create-deal/hackathon/"
+
+    # Shared client so requests reuse pooled keep-alive connections instead of a new TLS handshake each time
+    _client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use
+        """
+        if cls._client is None:
+            cls._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=UPSWAP_POOL_SIZE, max_keepalive_connections=UPSWAP_POOL_SIZE)
+            )
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Close the shared HTTP client and its pooled connections
+        """
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
     
     @staticmethod
     async def create_deal(deal_data: CreateDealRequest) -> CreateDealResponse:
@@ -12,31 +38,29 @@ class UpswapService:
         Create a deal using the Upswap API
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{UpswapService.BASE_URL}/create-deal/hackathon/",
-                    json=deal_data.model_dump(),
-                    timeout=30.0
+            response = await UpswapService.get_client().post(
+                UpswapService.CREATE_DEAL_URL,
+                json=deal_data.model_dump()
+            )
+            
+            response.raise_for_status()
+            api_response = response.json()
+            
+            # Extract the data from the API response
+            if api_response.get('data'):
+                deal_data = api_response['data']
+                return CreateDealResponse(
+                    success=True,
+                    message=api_response.get('message', 'Deal created successfully'),
+                    data=DealResponseData(**deal_data)
+                )
+            else:
+                return CreateDealResponse(
+                    success=False,
+                    message="No deal data received from API",
+                    error="Missing deal data in response"
                 )
-                
-                response.raise_for_status()
-                api_response = response.json()
-                
-                # Extract the data from the API response
-                if api_response.get('data'):
-                    deal_data = api_response['data']
-                    return CreateDealResponse(
-                        success=True,
-                        message=api_response.get('message', 'Deal created successfully'),
-                        data=DealResponseData(**deal_data)
-                    )
-                else:
-                    return CreateDealResponse(
-                        success=False,
-                        message="No deal data received from API",
-                        error="Missing deal data in response"
-                    )
-                
+            
         except httpx.HTTPError as e:
             logger.error(f"HTTP error occurred while creating deal: {str(e)}")
             return CreateDealResponse(
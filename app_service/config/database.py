@@ -1,6 +1,7 @@
 import os
 from dotenv import load_dotenv
 from logger_config import logger
+from config.settings import env_int
 
 # Load environment variables from .env file if it exists
 load_dotenv()
@@ -30,6 +31,9 @@ except ValueError:
     )
     DATABASES['default']['PORT'] = 5432
 
+# Per worker process; keep DB_POOL_MAX_SIZE * WORKERS below the server's max_connections
+DB_POOL_MAX_SIZE = env_int("DB_POOL_MAX_SIZE", 10)
+
 def are_db_settings_valid(db_alias: str = 'default') -> bool:
     """Checks if essential database settings for the given alias are present."""
     db_config = DATABASES.get(db_alias)
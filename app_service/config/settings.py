@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from logger_config import logger
 
 # Load environment variables from .env file if it exists
 load_dotenv()
@@ -13,9 +14,47 @@ APP_DESCRIPTION = "API for deal agent mechanics and database insights."
 DEFAULT_PORT = 8008
 HOST = "0.0.0.0"
 
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read a positive integer setting, falling back to the default with a warning on a bad value."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(f"Invalid {name}: '{raw}'. Defaulting to {default}.")
+        return default
+    if value < minimum:
+        logger.warning(f"Invalid {name}: '{raw}' (must be at least {minimum}). Defaulting to {default}.")
+        return default
+    return value
+
+# Read once at import so callers never go back to os.environ
+SERVER_PORT = env_int("PORT", DEFAULT_PORT)
+
+# Auto-reload is for local development only; it runs a file watcher alongside the server
+DEBUG = os.getenv("DEBUG", "0") == "1"
+WORKERS = env_int("WORKERS", 1)
+
+# Shared by run.py and api/main.py. "auto" picks uvloop/httptools when installed and falls
+# back to asyncio/h11 otherwise; access logs are kept for local debugging only.
+UVICORN_OPTIONS = {"loop": "auto", "http": "auto", "access_log": DEBUG}
+
+# Connection pools are per worker process, so the totals are POOL_SIZE * WORKERS
+UPSWAP_POOL_SIZE = env_int("UPSWAP_POOL_SIZE", 32)
+
 # AI Settings
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL_NAME = "gemini-1.5-flash-latest"
+GEMINI_REQUESTS_PER_MINUTE = env_int("GEMINI_REQUESTS_PER_MINUTE", 60)
+GEMINI_MAX_CONCURRENCY = env_int("GEMINI_MAX_CONCURRENCY", 8)
+# A bulk suggestion request waits on the RPM window inside one HTTP request; cap it at ~30s of budget
+BULK_SUGGEST_MAX_ITEMS = max(1, GEMINI_REQUESTS_PER_MINUTE // 2)
+
+# Deal Cache Settings
+REDIS_URL = os.getenv("REDIS_URL")
+DEAL_CACHE_TTL_SECONDS = 3600
+DEAL_CACHE_LOCAL_SIZE = 256
 
 # Logging Settings
 LOG_LEVEL = "DEBUG"
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+# Modules import each other as top-level packages (config, logger_config, api), as under run.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CREATE_DEAL_PAYLOAD = {
+    "deal_title": "Weekend Bakery Special",
+    "deal_description": "Delicious cakes, pastries, and fresh bread at half price!",
+    "select_service": "Food & Dining",
+    "uploaded_images": [{"thumbnail": "https://example.com/t.webp", "compressed": "https://example.com/c.webp"}],
+    "start_date": "2025-11-22",
+    "end_date": "2025-11-23",
+    "start_time": "09:00:00",
+    "end_time": "19:00:00",
+    "start_now": "true",
+    "actual_price": "600",
+    "deal_price": "300",
+    "available_deals": "25",
+    "location_house_no": "Shop No. 7, Sunrise Complex",
+    "location_road_name": "MG Road",
+    "location_country": "India",
+    "location_state": "Karnataka",
+    "location_city": "Bangalore",
+    "location_pincode": "560001",
+    "vendor_kyc": "e88fe995-b11b-478a-86ca-63fd047752b9",
+    "latitude": 12.9716,
+    "longitude": 77.5946,
+}
+
+
+@pytest.fixture
+def deal_payload():
+    """A create-deal body in the shape test/create-deal.py sends to Upswap."""
+    return dict(CREATE_DEAL_PAYLOAD)
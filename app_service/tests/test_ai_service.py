@@ -0,0 +1,84 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from api.services.ai_service import _parse_ai_deal, _read_json_stream
+
+DEAL_JSON = (
+    '{"suggested_product_sku": "UMB-LG-BLK-001", '
+    '"deal_details_suggestion_text": "Stay dry!", '
+    '"suggested_discount_type": "fixed_amount", '
+    '"suggested_discount_value": 80.20}'
+)
+
+
+class FakeStream:
+    """Stands in for a Gemini streaming response; records how many chunks were consumed."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.consumed = 0
+
+    async def __aiter__(self):
+        for text in self.texts:
+            self.consumed += 1
+            yield SimpleNamespace(parts=[text], text=text)
+
+
+def read(stream):
+    return asyncio.run(_read_json_stream(stream)).strip()
+
+
+def test_plain_stream_parses():
+    stream = FakeStream([DEAL_JSON[:40], DEAL_JSON[40:]])
+    deal = _parse_ai_deal(read(stream))
+    assert deal.suggested_product_sku == "UMB-LG-BLK-001"
+    assert deal.suggested_discount_value == 80.20
+
+
+def test_fenced_stream_parses_without_closing_fence():
+    stream = FakeStream(["```json\n" + DEAL_JSON[:40], DEAL_JSON[40:], "\n```"])
+    output = read(stream)
+
+    # Streaming stops at the closing brace, so the closing fence is never read
+    assert stream.consumed == 2
+    assert not output.endswith("```")
+
+    deal = _parse_ai_deal(output)
+    assert deal.suggested_discount_type == "fixed_amount"
+
+
+def test_brace_inside_string_does_not_end_stream():
+    deal_json = DEAL_JSON.replace("Stay dry!", "Smile :} and {stay} dry")
+    split = deal_json.index(":}") + 2
+    stream = FakeStream([deal_json[:split], deal_json[split:]])
+    output = read(stream)
+
+    assert stream.consumed == 2
+    assert _parse_ai_deal(output).deal_details_suggestion_text == "Smile :} and {stay} dry"
+
+
+def test_escaped_quote_inside_string_is_handled():
+    deal_json = DEAL_JSON.replace("Stay dry!", 'The \\"big\\" one }')
+    split = deal_json.index("big")
+    stream = FakeStream([deal_json[:split], deal_json[split:], "trailing chunk"])
+    output = read(stream)
+
+    assert stream.consumed == 2
+    assert _parse_ai_deal(output).deal_details_suggestion_text == 'The "big" one }'
+
+
+def test_fenced_output_with_closing_fence_parses():
+    deal = _parse_ai_deal("```json\n" + DEAL_JSON + "\n```")
+    assert deal.suggested_product_sku == "UMB-LG-BLK-001"
+
+
+def test_unparseable_output_raises():
+    with pytest.raises(ValueError):
+        _parse_ai_deal("no deal today")
+
+
+def test_percentage_over_100_rejected():
+    with pytest.raises(ValueError):
+        _parse_ai_deal(DEAL_JSON.replace("fixed_amount", "percentage").replace("80.20", "120"))
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.models.deals import CreateDealResponse
+from api.services import deal_jobs
+from api.services.upswap_service import UpswapService
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the shared redis.asyncio client."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    async def get(self, key):
+        return self.store.get(key)
+
+
+@pytest.fixture(autouse=True)
+def clear_jobs(monkeypatch):
+    monkeypatch.setattr(deal_jobs, "_jobs", type(deal_jobs._jobs)())
+    monkeypatch.setattr(deal_jobs, "get_redis", lambda: None)
+
+
+@pytest.fixture
+def client():
+    # No context manager: startup (DB pool, Redis) is not needed for these routes
+    return TestClient(app)
+
+
+def fake_create_deal(monkeypatch, success):
+    async def create_deal(deal_data):
+        if success:
+            return CreateDealResponse(success=True, message="Deal created successfully")
+        return CreateDealResponse(success=False, message="Failed to create deal", error="HTTP error: 400")
+
+    monkeypatch.setattr(UpswapService, "create_deal", staticmethod(create_deal))
+
+
+@pytest.mark.parametrize("success, status", [(True, "completed"), (False, "failed")])
+def test_accept_then_poll_status(client, monkeypatch, deal_payload, success, status):
+    fake_create_deal(monkeypatch, success)
+
+    accepted = client.post("/deals/create-deal/async", json=deal_payload)
+    assert accepted.status_code == 202
+    tracking_id = accepted.json()["tracking_id"]
+    assert accepted.json()["status"] == "accepted"
+
+    # TestClient runs background tasks before returning the response
+    job = client.get(f"/deals/create-deal/status/{tracking_id}")
+    assert job.status_code == 200
+    assert job.json()["status"] == status
+    assert job.json()["result"]["success"] is success
+
+
+def test_unknown_tracking_id_is_404(client):
+    response = client.get("/deals/create-deal/status/does-not-exist")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Unknown tracking id"
+
+
+def test_status_is_shared_through_redis(client, monkeypatch, deal_payload):
+    redis = FakeRedis()
+    monkeypatch.setattr(deal_jobs, "get_redis", lambda: redis)
+    fake_create_deal(monkeypatch, True)
+
+    tracking_id = client.post("/deals/create-deal/async", json=deal_payload).json()["tracking_id"]
+
+    # Another worker has none of this worker's in-process state
+    deal_jobs._jobs.clear()
+    job = client.get(f"/deals/create-deal/status/{tracking_id}")
+    assert job.status_code == 200
+    assert job.json()["status"] == "completed"
+
+
+def test_eviction_keeps_jobs_that_are_still_running(monkeypatch):
+    monkeypatch.setattr(deal_jobs, "MAX_TRACKED_JOBS", 2)
+
+    async def run():
+        running = await deal_jobs.create_job()
+        finished = await deal_jobs.create_job()
+        deal_jobs._jobs[finished]["status"] = "completed"
+        newest = await deal_jobs.create_job()
+        return running, finished, newest
+
+    running, finished, newest = asyncio.run(run())
+    assert list(deal_jobs._jobs) == [running, newest]
@@ -0,0 +1,92 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from config.settings import BULK_SUGGEST_MAX_ITEMS
+from api.dependencies.ai import require_ai_configured
+from api.main import app
+from api.models.deals import DealSuggestion
+from api.routers import deals
+
+
+def suggestion_request(vendor_id="vendor-1"):
+    return {
+        "event_data": {
+            "vendor_id": vendor_id,
+            "location_uuid": "loc-1",
+            "event_trigger_point": "weather",
+            "event_details_text": {"event_name": "Marathon"},
+            "event_location_latitude": 28.6,
+            "event_location_longitude": 77.2,
+            "event_timestamp": "2024-06-01T07:00:00",
+        },
+        "inventory_items": [{
+            "sku": "UMB-LG-BLK-001",
+            "product_name": "Large Umbrella",
+            "price": 400.0,
+            "quantity_on_hand": 25,
+            "category": "Accessories",
+        }],
+    }
+
+
+def fake_suggestion(vendor_id):
+    return DealSuggestion(
+        vendor_id=vendor_id,
+        event_id=0,
+        inventory_item_id=0,
+        suggested_product_sku="UMB-LG-BLK-001",
+        deal_details_prompt="",
+        deal_details_suggestion_text="Stay dry!",
+        suggested_discount_type="fixed_amount",
+        suggested_discount_value=80.0,
+        original_price=400.0,
+        suggested_price=320.0,
+        ai_model_name="test-model",
+        ai_response_payload={},
+    )
+
+
+@pytest.fixture
+def client():
+    # No context manager: startup (DB pool, Redis) is not needed for these routes
+    app.dependency_overrides[require_ai_configured] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_bulk_generates_identical_items_once(client, monkeypatch):
+    calls = []
+
+    async def fake_get_deal_suggestions(request, conn):
+        calls.append(request.event_data.vendor_id)
+        return [fake_suggestion(request.event_data.vendor_id)]
+
+    monkeypatch.setattr(deals, "get_deal_suggestions", fake_get_deal_suggestions)
+
+    body = {"requests": [suggestion_request(), suggestion_request("vendor-2"), suggestion_request()]}
+    response = client.post("/deals/suggest/bulk", json=body)
+
+    assert response.status_code == 200
+    assert sorted(calls) == ["vendor-1", "vendor-2"]
+    results = response.json()
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert [result["suggestions"][0]["vendor_id"] for result in results] == ["vendor-1", "vendor-2", "vendor-1"]
+
+
+def test_bulk_hides_error_details(client, monkeypatch):
+    async def failing_get_deal_suggestions(request, conn):
+        raise ValueError("Unexpected error during AI interaction: upstream secret")
+
+    monkeypatch.setattr(deals, "get_deal_suggestions", failing_get_deal_suggestions)
+
+    response = client.post("/deals/suggest/bulk", json={"requests": [suggestion_request()]})
+
+    assert response.status_code == 200
+    assert response.json()[0] == {
+        "index": 0, "success": False, "suggestions": [], "error": "Failed to get deal suggestions"
+    }
+
+
+def test_bulk_rejects_batches_over_the_rpm_cap(client):
+    body = {"requests": [suggestion_request() for _ in range(BULK_SUGGEST_MAX_ITEMS + 1)]}
+    assert client.post("/deals/suggest/bulk", json=body).status_code == 422
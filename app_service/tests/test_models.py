@@ -0,0 +1,35 @@
+import pytest
+from pydantic import ValidationError
+
+from api.models.deals import CreateDealRequest
+
+
+@pytest.fixture
+def deal(deal_payload):
+    return lambda **overrides: CreateDealRequest(**{**deal_payload, **overrides})
+
+
+@pytest.mark.parametrize("field, value", [
+    ("start_time", "09:00"),
+    ("start_time", "13:37:05.746043"),
+    ("start_now", "True"),
+    ("start_now", "1"),
+    ("actual_price", "600.125"),
+    ("actual_price", "1,200.00"),
+    ("vendor_kyc", "not-a-uuid"),
+])
+def test_passthrough_formats_accepted(deal, field, value):
+    assert getattr(deal(**{field: value}), field) == value
+
+
+@pytest.mark.parametrize("field, value", [
+    ("start_date", "22-11-2025"),
+    ("start_date", "2025-11-22T09:00:00"),
+    ("end_time", "7pm"),
+    ("end_time", "19:00:00:00"),
+    ("available_deals", "25.5"),
+    ("available_deals", "-1"),
+])
+def test_malformed_formats_rejected(deal, field, value):
+    with pytest.raises(ValidationError):
+        deal(**{field: value})
@@ -0,0 +1,113 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from api.services import rate_limiter
+from api.services.rate_limiter import AimdConcurrency, SlidingWindow
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def test_window_admits_up_to_max_calls_without_waiting(clock):
+    async def run():
+        window = SlidingWindow(max_calls=3, period=60)
+        for _ in range(3):
+            await window.wait()
+
+    asyncio.run(run())
+    assert clock.sleeps == []
+
+
+def test_window_refills_after_period(clock):
+    async def run():
+        window = SlidingWindow(max_calls=2, period=60)
+        await window.wait()
+        clock.now += 10
+        await window.wait()
+        # Full: the next call waits until the oldest call leaves the window
+        await window.wait()
+
+    asyncio.run(run())
+    assert clock.sleeps == [50]
+    assert clock.now == 1060
+
+
+def test_window_admits_again_once_old_calls_expire(clock):
+    async def run():
+        window = SlidingWindow(max_calls=1, period=60)
+        await window.wait()
+        clock.now += 61
+        await window.wait()
+
+    asyncio.run(run())
+    assert clock.sleeps == []
+
+
+def test_throttle_halves_limit():
+    limiter = AimdConcurrency(max_limit=8)
+    limiter.on_throttled()
+    assert limiter.limit == 4
+    limiter.on_throttled()
+    assert limiter.limit == 2
+
+
+def test_throttle_never_drops_below_one():
+    limiter = AimdConcurrency(max_limit=2)
+    for _ in range(5):
+        limiter.on_throttled()
+    assert limiter.limit == 1
+
+
+def test_success_grows_additively_up_to_max():
+    limiter = AimdConcurrency(max_limit=4)
+    limiter.on_throttled()
+    assert limiter.limit == 2
+    limiter.on_success()
+    assert limiter.limit == 2.5
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.limit == 4
+
+
+def test_slot_respects_current_limit():
+    async def run():
+        limiter = AimdConcurrency(max_limit=4)
+        limiter.on_throttled()
+        limiter.on_throttled()  # limit is now 1
+        peak = 0
+
+        async def task():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter._in_flight)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(task() for _ in range(5)))
+        return peak
+
+    assert asyncio.run(run()) == 1
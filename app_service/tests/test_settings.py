@@ -0,0 +1,17 @@
+from config.settings import env_int
+
+
+def test_env_int_reads_value(monkeypatch):
+    monkeypatch.setenv("TEST_SETTING", "4")
+    assert env_int("TEST_SETTING", 1) == 4
+
+
+def test_env_int_defaults_when_unset(monkeypatch):
+    monkeypatch.delenv("TEST_SETTING", raising=False)
+    assert env_int("TEST_SETTING", 7) == 7
+
+
+def test_env_int_falls_back_on_bad_values(monkeypatch):
+    for raw in ("abc", "1.5", "", "0", "-3"):
+        monkeypatch.setenv("TEST_SETTING", raw)
+        assert env_int("TEST_SETTING", 7) == 7
@@ -0,0 +1,74 @@
+import json
+import socket
+import sys
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+# Connections kept per host; also the most worker threads a script should run against one session
+POOL_SIZE = 10
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter that adds TCP keepalive to urllib3's default socket options (which already set TCP_NODELAY)."""
+
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def configure_session(session):
+    """Mount the pooled, retrying adapter on a session (plain or cached) and return it."""
+    session.mount("https://", SocketOptionsAdapter(
+        pool_connections=10,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]),
+    ))
+    # Explicit JSON Accept skips server-side content negotiation
+    session.headers.update({
+        "Accept": "application/json",
+        "User-Agent": "deals-agent-test-scripts/1.0",
+    })
+    return session
+
+
+# Shared keep-alive session so repeated calls reuse the TCP+TLS connection.
+# Accept-Encoding is left to requests: it offers br alongside gzip whenever brotli is installed.
+SESSION = configure_session(requests.Session())
+
+# (connect, read): fail fast on an unreachable host, allow the API time to respond
+TIMEOUT = (3.05, 10)
+
+try:
+    import orjson
+except ImportError:  # the scripts still run, just slower, without orjson installed
+    orjson = None
+
+
+def read_json(response):
+    """Parse the raw body bytes with orjson instead of response.json()'s decode-then-parse."""
+    if orjson is None:
+        return json.loads(response.content.decode("utf-8"))
+    return orjson.loads(response.content)
+
+
+def read_text(response):
+    """Decode the body as UTF-8 (RFC 8259) unless the server says otherwise, skipping charset detection."""
+    return response.content.decode(response.encoding or "utf-8", errors="replace")
+
+
+def write_json(data):
+    """Write data to stdout as JSON bytes, indented only when printing to a terminal."""
+    if orjson is None:
+        print(json.dumps(data, indent=2 if sys.stdout.isatty() else None))
+        return
+    option = orjson.OPT_APPEND_NEWLINE
+    if sys.stdout.isatty():
+        option |= orjson.OPT_INDENT_2
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    sys.stdout.buffer.write(orjson.dumps(data, option=option))
@@ -1,18 +1,18 @@
-import requests
+from _http import SESSION, TIMEOUT, read_json, read_text
  
 vendor_id = "6971cb91-b62b-4e5c-af83-a5baa82dfab3"
  
 url = f"https://api.upswap.app/api/check-vendor/{vendor_id}/"
  
-response = requests.get(url)
+response = SESSION.get(url, timeout=TIMEOUT)
  
 if response.status_code == 200:
     print("Success:")
-    print(response.json())
+    print(read_json(response))
 else:
     print(f"Request failed with status code: {response.status_code}")
     print("Response text:")
-    print(response.text)
+    print(read_text(response))
 
 
 
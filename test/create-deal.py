@@ -1,4 +1,4 @@
-import requests
+from _http import SESSION, TIMEOUT, read_json, read_text
 
 url = "https://api.upswap.app/api/create-deal/hackathon/"
 
@@ -29,16 +29,16 @@ payload = {
     "longitude": 77.5946 # Approx longitude for Bangalore
 }
 
-response = requests.post(url, json=payload)
+response = SESSION.post(url, json=payload, timeout=TIMEOUT)
 
 # It's good practice to check the status code before trying to parse JSON
 if response.status_code == 200 or response.status_code == 201: # Or whatever success codes are expected
     print("Success:")
-    print(response.json())
+    print(read_json(response))
 else:
     print(f"Request failed with status code: {response.status_code}")
     print("Response text:")
-    print(response.text)
+    print(read_text(response))
 
 
 
@@ -1,10 +1,11 @@
-import requests
+from _http import SESSION, TIMEOUT, read_json
 
 url = "https://api.upswap.app/api/activities/lists/"
 
-response = requests.get(url)
+response = SESSION.get(url, timeout=TIMEOUT)
+response.raise_for_status()
 
-print(response.json())
+print(read_json(response))
 
 
 
@@ -1,16 +1,16 @@
-import requests
+from _http import SESSION, TIMEOUT, read_json, read_text
 
 url = "https://api.upswap.app/api/vendor/lists/"
  
-response = requests.get(url)
+response = SESSION.get(url, timeout=TIMEOUT)
  
 if response.status_code == 200:
     print("Success:")
-    print(response.json())
+    print(read_json(response))
 else:
     print(f"Request failed with status code: {response.status_code}")
     print("Response text:")
-    print(response.text)
+    print(read_text(response))
     
     
     
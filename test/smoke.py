@@ -0,0 +1,42 @@
+import asyncio
+import httpx
+
+# Read-only endpoints exercised by the individual scripts in this folder.
+# create-deal.py is left out on purpose: it creates a real deal on every run.
+BASE_URL = "https://api.upswap.app/api"
+ENDPOINTS = {
+    "check-is-vendor": f"{BASE_URL}/check-vendor/6971cb91-b62b-4e5c-af83-a5baa82dfab3/",
+    "list-vendors": f"{BASE_URL}/vendor/lists/",
+    "list-activities": f"{BASE_URL}/activities/lists/",
+    "view-activity-details": f"{BASE_URL}/activities/details/4cb3a135-3741-48fb-86dd-eac0803de890/",
+    "view-vendor-details": f"{BASE_URL}/vendor/details/d36fb11e-a4a6-4e2c-936b-ff296946a599/",
+}
+
+
+async def main():
+    # One HTTP/2 connection multiplexes every request (needs `pip install httpx[http2]`)
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=16),
+        timeout=10,
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.get(url) for url in ENDPOINTS.values()),
+            return_exceptions=True,
+        )
+
+    failed = 0
+    for name, response in zip(ENDPOINTS, responses):
+        if isinstance(response, Exception):
+            failed += 1
+            print(f"FAIL {name}: {response!r}")
+        elif response.is_success:
+            print(f"OK   {name}: {response.status_code} in {response.elapsed.total_seconds():.3f}s")
+        else:
+            failed += 1
+            print(f"FAIL {name}: {response.status_code} {response.content[:200].decode('utf-8', errors='replace')}")
+    return failed
+
+
+if __name__ == "__main__":
+    raise SystemExit(1 if asyncio.run(main()) else 0)
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from _http import SESSION, TIMEOUT, read_json
+
+# Live checks against the production Upswap API; run with `UPSWAP_LIVE_TESTS=1 pytest test/test_api.py`.
+# One shared session means every parametrized case reuses the same pooled connections.
+BASE_URL = "https://api.upswap.app/api"
+
+# Skipped by default so offline and CI runs never hit production
+pytestmark = pytest.mark.skipif(
+    not os.getenv("UPSWAP_LIVE_TESTS"),
+    reason="live Upswap API tests; set UPSWAP_LIVE_TESTS=1 to run",
+)
+
+
+@pytest.fixture(scope="session")
+def session():
+    yield SESSION
+    SESSION.close()
+
+
+# check-vendor takes a user id (and answers with that user's vendor_id, if any)
+@pytest.mark.parametrize("user_id", [
+    "6971cb91-b62b-4e5c-af83-a5baa82dfab3",
+    "0aa31117-5565-4360-aaf1-05730362706e",
+])
+def test_check_vendor(session, user_id):
+    response = session.get(f"{BASE_URL}/check-vendor/{user_id}/", timeout=TIMEOUT)
+    assert response.status_code == 200
+    assert "is_vendor" in read_json(response)
+
+
+@pytest.mark.parametrize("path, key", [
+    ("vendor/lists/", "vendors"),
+    ("vendor/details/d36fb11e-a4a6-4e2c-936b-ff296946a599/", "vendor_id"),
+    ("activities/details/4cb3a135-3741-48fb-86dd-eac0803de890/", "activity_id"),
+])
+def test_details_and_lists(session, path, key):
+    response = session.get(f"{BASE_URL}/{path}", timeout=TIMEOUT)
+    assert response.status_code == 200
+    assert key in read_json(response)
+
+
+def test_list_activities(session):
+    response = session.get(f"{BASE_URL}/activities/lists/", timeout=TIMEOUT)
+    assert response.status_code == 200
+    assert isinstance(read_json(response), list)
@@ -1,16 +1,17 @@
 import requests
 import json
+from _http import SESSION, TIMEOUT, read_json, write_json
 
 BASE_URL = "https://api.upswap.app/api/activities/details/"
 ACTIVITY_ID = "4cb3a135-3741-48fb-86dd-eac0803de890"
 API_URL = f"{BASE_URL}{ACTIVITY_ID}/"
 
 try:
-    response = requests.get(API_URL, timeout=10)
+    response = SESSION.get(API_URL, timeout=TIMEOUT)
     response.raise_for_status()
-    data = response.json()
+    data = read_json(response)
     print("Success:")
-    print(json.dumps(data, indent=4))
+    write_json(data)
 
 except requests.exceptions.HTTPError as http_err:
     print(f"HTTP error occurred: {http_err}")
@@ -1,16 +1,72 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
 import requests
 
-url = "https://api.upswap.app/api/vendor/details/d36fb11e-a4a6-4e2c-936b-ff296946a599/"
+from _http import POOL_SIZE, SESSION, TIMEOUT, configure_session, read_json, read_text, write_json
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
-response = requests.get(url)
+DEFAULT_VENDOR_ID = "d36fb11e-a4a6-4e2c-936b-ff296946a599"
+VENDOR_URL = "https://api.upswap.app/api/vendor/details/{}/".format
 
-if response.status_code == 200:
-    print("Success:")
-    print(response.json())
+# Vendor details rarely change: keep them in a local cache and revalidate with
+# If-None-Match / If-Modified-Since, so a hit costs a 304 with no body (or no request at all)
+if requests_cache is not None:
+    VENDOR_SESSION = configure_session(requests_cache.CachedSession(
+        str(Path(__file__).with_name("vendor_cache")),
+        backend="sqlite",
+        cache_control=True,
+        expire_after=300,
+    ))
 else:
-    print(f"Request failed with status code: {response.status_code}")
-    print("Response text:")
-    print(response.text)
+    VENDOR_SESSION = SESSION
+
+
+@lru_cache(maxsize=1024)
+def get_vendor(vendor_id):
+    """Vendor details as a dict; repeat ids within one process are answered from memory."""
+    response = VENDOR_SESSION.get(VENDOR_URL(vendor_id), timeout=TIMEOUT)
+    response.raise_for_status()
+    return read_json(response)
+
+
+def fetch_vendors(vendor_ids):
+    """Fetch vendors concurrently on the shared session; one worker per pooled connection.
+
+    Returns, in order, each vendor's dict or the exception its lookup raised.
+    """
+    with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(vendor_ids))) as executor:
+        futures = [executor.submit(get_vendor, vendor_id) for vendor_id in vendor_ids]
+    return [future.exception() or future.result() for future in futures]
+
+
+def show(result):
+    if isinstance(result, requests.HTTPError):
+        print(f"Request failed with status code: {result.response.status_code}")
+        print("Response text:")
+        print(read_text(result.response))
+    elif isinstance(result, Exception):
+        print(f"Request failed: {result}")
+    else:
+        print("Success:")
+        write_json(result)
+
+
+def main():
+    vendor_ids = sys.argv[1:] or [DEFAULT_VENDOR_ID]
+
+    for result in fetch_vendors(vendor_ids):
+        show(result)
+
+
+if __name__ == "__main__":
+    main()
 
 
 